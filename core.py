@@ -1,17 +1,275 @@
-import asyncio 
+import asyncio
 import httpx
-import json 
-import pandas as pd 
-import numpy as np
-import os 
-import io 
+import json
+import os
+import io
 import re
+import sys
 import mimetypes
-from requests import request
+import mmap
+from uuid import uuid4
+from .credentials import _SESSION
+from functools import lru_cache
 from itertools import chain
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from time import time
 from .utils import num2letter, jq_lite, GoogleAuthBuilder
 
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+pd = None
+np = None
+# Bound on first pandas use so hot API entry points avoid the attribute walk
+# through pandas (pd.core.frame.DataFrame is a deprecated alias resolved via
+# __getattr__ on every access).
+_DF = None
+_STR = str
+
+
+def _load_pandas():
+    """
+    Import pandas/numpy on first DataFrame use. Drive/YouTube-only callers
+    never touch DataFrames, so they skip the several-hundred-ms import and
+    its memory footprint entirely.
+    """
+    global pd, np, _DF
+    if pd is None:
+        import pandas
+        import numpy
+        pd = pandas
+        np = numpy
+        _DF = pandas.DataFrame
+    return pd
+
+def _json_dumps(obj):
+    """
+    Compact JSON as UTF-8 bytes, via orjson when available. Bytes, not str:
+    http.client encodes str bodies as latin-1, which breaks (or silently
+    corrupts) non-ASCII values such as file names.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+def _as_list(x):
+    """
+    Normalize a str-or-sequence argument to a list, without copying inputs
+    that already are lists.
+    """
+    if isinstance(x, str):
+        return [x]
+    if isinstance(x, list):
+        return x
+    return list(x)
+
+
+# Compiled once; YouTube video ids are 11 chars, channel ids 24.
+_YT_VID_ID_RE = re.compile(r"^[-_A-Za-z0-9]{11}$")
+_YT_CID_ID_RE = re.compile(r"^[-_A-Za-z0-9]{24}$")
+
+# URL-parsing patterns, compiled once at import time. The original [A-z]
+# classes also matched "[\]^_`" and are narrowed to the intended ranges.
+_YT_VID_PATTERN = (
+    r"(?:youtube(?:-nocookie)*\.com.*(?:vi*=|vi*%3D|/(?:embed|vi*|e|shorts|u/\d+)/)"
+    r"|youtu\.be/)([A-Za-z0-9_-]{11})(?:[%#?&/\s]|$)"
+)
+_YT_VID_RE = re.compile(_YT_VID_PATTERN)
+
+# RE2 matches in linear time and releases the GIL, so huge url batches can
+# be matched across threads; stdlib re stays the fallback.
+try:
+    import re2
+    _YT_VID_RE2 = re2.compile(_YT_VID_PATTERN)
+except ImportError:
+    _YT_VID_RE2 = None
+# Searched, not matched: the old leading ".*"/"[\w\W]*" wrappers forced the
+# engine to anchor-and-backtrack across the whole input before the literal.
+_URL_CID = re.compile(r"youtube\.com/channel/([A-Za-z0-9_-]{24})")
+_HTML_CID = re.compile(
+    r'"(?:externalChannelId|externalId)":"([A-Za-z0-9_-]{24})"'
+)
+
+
+@lru_cache(maxsize=1024)
+def _guess_mime(ext):
+    """
+    Memoized extension -> mime type lookup; mimetypes guesses grab a global
+    lock and walk an internal table per call, which adds up on bulk uploads.
+    """
+    if not ext:
+        return None
+    return mimetypes.guess_type("x" + ext)[0]
+
+
+# Warm the cache for the extensions uploads see most often.
+for _ext in (".pdf", ".png", ".jpg", ".csv", ".json", ".xlsx", ".txt"):
+    _guess_mime(_ext)
+del _ext
+
+
+# Column letters indexed by zero-based column number; Sheets caps grids at
+# 18,278 columns ("ZZZ"), so the whole range is precomputable.
+_COL_LETTERS = tuple(num2letter(k + 1) for k in range(18278))
+
+
+# Output columns of k_vid_before_date with their pre-split response paths;
+# jq_lite takes the tuples directly, so nothing is tokenized per call.
+_PLAYLISTITEM_COLS = (
+    ("id", ("id",)),
+    ("channelId", ("snippet", "channelId")),
+    ("videoId", ("contentDetails", "videoId")),
+    ("publishedAt", ("contentDetails", "videoPublishedAt")),
+    ("title", ("snippet", "title")),
+    ("description", ("snippet", "description")),
+    ("channelTitle", ("snippet", "channelTitle"))
+)
+
+
+class _Admission:
+    """
+    Concurrency gate with a movable ceiling. Behaves like a semaphore, but
+    the limit shrinks when the remote host pushes back with 429s (down to
+    `floor`) and grows back on successes, so retries never stampede a
+    rate-limited server.
+    """
+
+    def __init__(self, limit=50, floor=4):
+        self._active = 0
+        self._limit = limit
+        self._ceiling = limit
+        self._floor = floor
+        self._cond = asyncio.Condition()
+
+    async def __aenter__(self):
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._active < self._limit)
+            self._active += 1
+
+    async def __aexit__(self, *exc):
+        async with self._cond:
+            self._active -= 1
+            self._cond.notify(1)
+
+    async def throttle(self):
+        async with self._cond:
+            if self._limit > self._floor:
+                self._limit -= 1
+
+    async def expand(self):
+        async with self._cond:
+            if self._limit < self._ceiling:
+                self._limit += 1
+                self._cond.notify(1)
+
+
+def _parse_batch_response(response):
+    """
+    Split a multipart/mixed batch response into the JSON payload of each
+    part. Each part wraps a complete HTTP response, so the payload sits
+    after the part headers and the inner status line + headers.
+    """
+    ctype = response.headers.get("Content-Type", "")
+    m = re.search(r'boundary="?([^";]+)"?', ctype)
+    if m is None:
+        return response.json()
+    out = []
+    for part in response.text.split("--" + m.group(1))[1:-1]:
+        payload = part.split("\r\n\r\n", 2)[-1].strip()
+        out.append(json.loads(payload) if payload else None)
+    return out
+
+
+# Minimal field masks for the common get_spreadsheet call sites; a preset
+# shrinks the payload by orders of magnitude compared to full grid data.
+_GET_SPREADSHEET_PRESETS = {
+    "values": "sheets.data.rowData.values.formattedValue",
+    "colors": "sheets.data.rowData.values.userEnteredFormat.backgroundColor",
+    "all": None
+}
+
+
+def _df_to_rows(v, include_header=False):
+    """
+    Convert a pandas DataFrame into a JSON-ready 2d array. NA masking is a
+    single vectorized pass (`np.copyto` on an object ndarray) instead of the
+    full-frame copy `fillna("")` would make, and it is skipped entirely when
+    the frame holds no NA at all -- `v.notna().values.all()` short-circuits
+    in C and is essentially free compared to a copy.
+    """
+    _load_pandas()
+    na_mask = v.isna().values
+    if na_mask.any():
+        # copy=True: for a single-block object frame to_numpy() returns a
+        # view of the caller's data, and the mask assignment below would
+        # blank out the caller's NaN cells in place.
+        arr = v.to_numpy(dtype=object, copy=True)
+        arr[na_mask] = ""
+        rows = arr.tolist()
+    else:
+        rows = v.to_numpy(copy=False).tolist()
+
+    # Sheet data is typically low-cardinality in its string columns;
+    # interning collapses the repeats to shared objects, which slashes the
+    # resident size of the row lists and the per-string hashing done by the
+    # JSON encoder.
+    obj_cols = [j for j, d in enumerate(v.dtypes) if d.kind == "O"]
+    if obj_cols:
+        intern = sys.intern
+        for row in rows:
+            for j in obj_cols:
+                c = row[j]
+                if type(c) is str:
+                    row[j] = intern(c)
+
+    if include_header:
+        rows.insert(0, v.columns.tolist())
+    return rows
+
+
+def _rows_to_df(rows, header):
+    """
+    Build a DataFrame from a header plus list-of-rows. When pyarrow is
+    available the rows go through pa.Table, which assembles typed columns in
+    C instead of pandas' row->column transpose with per-cell inference;
+    columns mixing cell types fall back to the plain constructor.
+    """
+    _load_pandas()
+    # from_pylist keys rows by name, so duplicate headers would keep only
+    # the last column (and over-wide rows would be truncated, not raised);
+    # those frames take the plain constructor instead.
+    if pa is not None and rows and len(set(header)) == len(header):
+        try:
+            tbl = pa.Table.from_pylist([dict(zip(header, row)) for row in rows])
+            return tbl.to_pandas(types_mapper=pd.ArrowDtype)
+        except Exception:
+            pass
+    return pd.DataFrame(rows, columns=header)
+
+
+def _copy_sheet_output(output):
+    """
+    Copy a cached `get_sheet` result before handing it out, so a caller
+    mutating the returned frame(s) cannot poison the cached copy.
+    """
+    if output.__class__ is _DF:
+        return output.copy()
+    return {k: v.copy() for k, v in output.items()}
+
 
 class GoogleAuth(GoogleAuthBuilder):
     """
@@ -69,7 +327,48 @@ class GoogleAuth(GoogleAuthBuilder):
         "https://www.googleapis.com/auth/youtube"
     ]
     """
-    def get_sheet(self, spreadsheetId, ranges, columns=None, 
+    _sheet_cache_ttl = 60
+    _sheet_cache_maxsize = 128
+
+    def __init__(self, acc_secret):
+        GoogleAuthBuilder.__init__(self, acc_secret)
+        self._sheet_cache = dict()
+        self._parent_cache = dict()
+
+    def sheet_cache_clear(self):
+        """
+        Drop all cached `get_sheet` responses.
+        """
+        self._sheet_cache.clear()
+
+    def _sheet_cache_drop(self, spreadsheetId):
+        """
+        Drop cached `get_sheet` entries for one spreadsheet. The write
+        paths call this so a read following this instance's own write
+        never serves the pre-write copy.
+        """
+        for k in [k for k in self._sheet_cache if k[0] == spreadsheetId]:
+            del self._sheet_cache[k]
+
+    def _sheet_cache_store(self, key, entry):
+        """
+        Insert one cache entry, evicting the least-recently-used entries
+        beyond `_sheet_cache_maxsize` so a long-running process reading
+        many ranges cannot grow the cache without bound.
+        """
+        cache = self._sheet_cache
+        cache.pop(key, None)
+        cache[key] = entry
+        while len(cache) > self._sheet_cache_maxsize:
+            del cache[next(iter(cache))]
+
+    def sheet_cache_info(self):
+        """
+        Return the cached `get_sheet` keys and their expiry timestamps.
+        """
+        return {k: v[1] for k, v in self._sheet_cache.items()}
+
+    def get_sheet(self, spreadsheetId, ranges, columns=None,
                   valueRenderOption="UNFORMATTED_VALUE", 
                   dateTimeRenderOption="SERIAL_NUMBER", 
                   majorDimension="ROWS", **kwargs):
@@ -133,30 +432,116 @@ class GoogleAuth(GoogleAuthBuilder):
                                 number format (which depends on the spreadsheet
                                 locale).
         """
+        _load_pandas()
         method = "sheets:v4.spreadsheets.values.batchGet"
-        ranges = [ranges] if type(ranges) is str else list(ranges) 
+        ranges = _as_list(ranges)
         
         if columns:
-            columns = list(columns) if type(columns) is not str else [columns]
-            if len(ranges) == 1 and ((not hasattr(columns[0], "__iter__")) or type(columns[0]) is str):
+            columns = [columns] if isinstance(columns, str) else list(columns)
+            if len(ranges) == 1 and ((not hasattr(columns[0], "__iter__")) or columns[0].__class__ is _STR):
                 columns = [columns]
-        
-        build_args = locals()
-        del build_args["self"]
+
+        build_args = {
+            "method": method,
+            "spreadsheetId": spreadsheetId,
+            "ranges": ranges,
+            "valueRenderOption": valueRenderOption,
+            "dateTimeRenderOption": dateTimeRenderOption,
+            "majorDimension": majorDimension,
+            "kwargs": kwargs
+        }
         service_doc, method_doc, method, url, params, body = self.build_params(**build_args)
-        response = self.request(method=method, url=url, params=params, body=body)
-        
+
+        cacheable = not kwargs.get("raw_output") and majorDimension != "COLUMNS"
+
+        if not cacheable:
+            response = self.request(method=method, url=url, params=params, body=body)
+            return self._sheet_output(response, columns, majorDimension, **kwargs)
+
+        ttl = kwargs.get("cache_ttl", self._sheet_cache_ttl)
+        key = (
+            spreadsheetId, tuple(ranges), valueRenderOption,
+            dateTimeRenderOption, majorDimension, repr(columns)
+        )
+        etag = None
+        output = None
+        cached = self._sheet_cache.get(key)
+        if cached is not None:
+            etag, expiry, output = cached
+            if time() < expiry:
+                # Re-insert so the hit counts as recently used.
+                self._sheet_cache[key] = self._sheet_cache.pop(key)
+                return _copy_sheet_output(output)
+
+        req_kwargs = {}
+        if etag:
+            req_kwargs["headers"] = {**self.headers, "If-None-Match": etag}
+        resp = self.request(
+            method=method, url=url, params=params, body=body,
+            stream=True, **req_kwargs
+        )
+
+        if resp.status_code == 304:
+            # Not modified: reuse the parsed output without re-fetching the
+            # body or rebuilding the DataFrame(s).
+            self._sheet_cache_store(key, (etag, time() + ttl, output))
+            return _copy_sheet_output(output)
+
+        if ijson is not None:
+            # Parse the body incrementally per valueRange, dispatching cells
+            # into per-column lists so the DataFrame is built from columns
+            # directly instead of a full dict tree plus a row->column
+            # transpose over the same bytes.
+            dfs = []
+            out_ranges = []
+            # requests leaves the raw stream undecoded; without this ijson
+            # would be fed gzip bytes whenever the server compresses the body.
+            resp.raw.decode_content = True
+            for i, vr in enumerate(ijson.items(resp.raw, "valueRanges.item", use_float=True)):
+                x = vr.get("values", [])
+                out_ranges.append(vr.get("range"))
+                if columns:
+                    hdr, rows = columns[i], x
+                else:
+                    hdr, rows = (x[0], x[1:]) if x else ([], [])
+                cols_data = [[] for _ in hdr]
+                for row in rows:
+                    nrow = len(row)
+                    for j in range(len(hdr)):
+                        cols_data[j].append(row[j] if j < nrow else None)
+                if len(set(hdr)) != len(hdr):
+                    # Duplicate header names would collapse in a dict;
+                    # build positionally and relabel to keep every column.
+                    df = pd.DataFrame(dict(enumerate(cols_data)), copy=False)
+                    df.columns = hdr
+                else:
+                    df = pd.DataFrame(dict(zip(hdr, cols_data)), copy=False)
+                dfs.append(df)
+
+            output = dfs[0] if len(dfs) == 1 else dict(zip(out_ranges, dfs))
+        else:
+            output = self._sheet_output(resp.json(), columns, majorDimension, **kwargs)
+
+        self._sheet_cache_store(key, (resp.headers.get("ETag"), time() + ttl, output))
+        return _copy_sheet_output(output)
+
+    def _sheet_output(self, response, columns, majorDimension, **kwargs):
+        """
+        Convert a batchGet response into DataFrame(s); shared by the sync
+        and async fetch paths.
+        """
         if kwargs.get("raw_output") or majorDimension == "COLUMNS":
-            return response 
-        
-        f = "valueRanges.values"
+            return response
+
         output = []
-        for i, x in enumerate(jq_lite(response, f)):
+        for i, vr in enumerate(response["valueRanges"]):
+            x = vr.get("values", [])
             if columns:
                 output.append(pd.DataFrame(x, columns=columns[i]))
             else:
-                output.append(pd.DataFrame(x[1:], columns=x[0]))
-        
+                hdr, rows = (x[0], x[1:]) if x else ([], [])
+                output.append(_rows_to_df(rows, hdr))
+
         if len(output) == 1:
             output = output[0]
         else:
@@ -166,6 +551,56 @@ class GoogleAuth(GoogleAuthBuilder):
             ))
 
         return output
+
+    async def aget_sheet(self, spreadsheetId, ranges, columns=None,
+                         valueRenderOption="UNFORMATTED_VALUE",
+                         dateTimeRenderOption="SERIAL_NUMBER",
+                         majorDimension="ROWS", **kwargs):
+        """
+        Async variant of `get_sheet` backed by the shared HTTP/2 client.
+        See `get_sheet` for the parameters.
+        """
+        _load_pandas()
+        method = "sheets:v4.spreadsheets.values.batchGet"
+        ranges = _as_list(ranges)
+
+        if columns:
+            columns = [columns] if isinstance(columns, str) else list(columns)
+            if len(ranges) == 1 and ((not hasattr(columns[0], "__iter__")) or columns[0].__class__ is _STR):
+                columns = [columns]
+
+        build_args = {
+            "method": method,
+            "spreadsheetId": spreadsheetId,
+            "ranges": ranges,
+            "valueRenderOption": valueRenderOption,
+            "dateTimeRenderOption": dateTimeRenderOption,
+            "majorDimension": majorDimension,
+            "kwargs": kwargs
+        }
+        service_doc, method_doc, method, url, params, body = self.build_params(**build_args)
+        response = await self.arequest(method=method, url=url, params=params, body=body)
+        return self._sheet_output(response, columns, majorDimension, **kwargs)
+
+    def get_sheets_bulk(self, specs):
+        """
+        Fetch many ranges/spreadsheets concurrently. `specs` is a list of
+        dicts of `get_sheet` keyword arguments; results come back in the
+        same order, multiplexed over one connection.
+        """
+        async def main():
+            try:
+                return await asyncio.gather(
+                    *[self.aget_sheet(**s) for s in specs]
+                )
+            finally:
+                # The loop dies with asyncio.run(), so close the pooled
+                # connections inside it rather than leaking them to a
+                # dead loop.
+                if self._aclient is not None:
+                    await self._aclient.aclose()
+                    self._aclient = None
+        return asyncio.run(main())
     
     def update_sheet(self, spreadsheetId, ranges, values, columns=True,
                      majorDimension="ROWS",
@@ -289,35 +724,74 @@ class GoogleAuth(GoogleAuthBuilder):
                                 number format (which depends on the spreadsheet
                                 locale).
         """
+        _load_pandas()
         method = "sheets:v4.spreadsheets.values.batchUpdate"
-        ranges = [ranges] if type(ranges) is str else list(ranges)
-
-        if type(values) is pd.core.frame.DataFrame:
-            values = [values]
-
-        for i, v in enumerate(values):
-            if type(v) is pd.core.frame.DataFrame:
-                c = [list(v.columns)] if columns else []
-                values[i] = c + v.fillna("").to_numpy().tolist()
-            
-        if len(ranges) != len(values):
-            raise Exception("len(ranges) != len(values)")
-        
-        data = []
-        for r, v in zip(ranges, values):
-            data.append({
-                "range": r,
+
+        if ranges.__class__ is _STR and values.__class__ is _DF:
+            # Common case: one range, one frame -- skip the list machinery.
+            data = [{
+                "range": ranges,
                 "majorDimension": majorDimension,
-                "values": v
-            })
-        
-        build_args = locals()
-        del build_args["self"]
+                "values": _df_to_rows(values, columns)
+            }]
+        else:
+            ranges = _as_list(ranges)
+
+            if values.__class__ is _DF:
+                values = [values]
+
+            for i, v in enumerate(values):
+                if v.__class__ is _DF:
+                    values[i] = _df_to_rows(v, columns)
+
+            if len(ranges) != len(values):
+                raise Exception("len(ranges) != len(values)")
+
+            data = [
+                {"range": r, "majorDimension": majorDimension, "values": v}
+                for r, v in zip(ranges, values)
+            ]
+
+        build_args = {
+            "method": method,
+            "spreadsheetId": spreadsheetId,
+            "valueInputOption": valueInputOption,
+            "data": data,
+            "includeValuesInResponse": includeValuesInResponse,
+            "responseValueRenderOption": responseValueRenderOption,
+            "responseDateTimeRenderOption": responseDateTimeRenderOption,
+            "kwargs": kwargs
+        }
         service_doc, method_doc, method, url, params, body = self.build_params(**build_args)
-        response = self.request(method=method, url=url, params=params, body=body)
 
+        if orjson is not None and len(data) > 1:
+            # Stream the body into one buffer, encoding each range entry
+            # separately, so the full JSON bytes never co-exist with a
+            # second all-at-once serialization of the whole dict tree.
+            buf = io.BytesIO()
+            buf.write(b'{"valueInputOption":')
+            buf.write(orjson.dumps(valueInputOption))
+            buf.write(b',"includeValuesInResponse":')
+            buf.write(b"true" if includeValuesInResponse else b"false")
+            buf.write(b',"responseValueRenderOption":')
+            buf.write(orjson.dumps(responseValueRenderOption))
+            buf.write(b',"responseDateTimeRenderOption":')
+            buf.write(orjson.dumps(responseDateTimeRenderOption))
+            buf.write(b',"data":[')
+            for i, entry in enumerate(data):
+                if i:
+                    buf.write(b",")
+                buf.write(orjson.dumps(entry, option=orjson.OPT_SERIALIZE_NUMPY))
+            buf.write(b"]}")
+            response = self.request(
+                method=method, url=url, params=params, raw_body=buf.getvalue()
+            )
+        else:
+            response = self.request(method=method, url=url, params=params, body=body)
+
+        self._sheet_cache_drop(spreadsheetId)
         return response
-    
+
 
     def clear_sheet(self, spreadsheetId, ranges, **kwargs):
         """
@@ -341,13 +815,18 @@ class GoogleAuth(GoogleAuthBuilder):
                     /sheets/api/guides/concepts#cell) of the values to clear.
         """
         method = "sheets:v4.spreadsheets.values.batchClear"
-        ranges = [ranges] if type(ranges) is str else list(ranges) 
-        build_args = locals()
-        del build_args["self"]
+        ranges = _as_list(ranges)
+        build_args = {
+            "method": method,
+            "spreadsheetId": spreadsheetId,
+            "ranges": ranges,
+            "kwargs": kwargs
+        }
         service_doc, method_doc, method, url, params, body = self.build_params(**build_args)
         response = self.request(method=method, url=url, params=params, body=body)
+        self._sheet_cache_drop(spreadsheetId)
         return response
-    
+
     def append_sheet(self, spreadsheetId, range, values, columns=False,
                      majorDimension="ROWS",
                      insertDataOption="INSERT_ROWS",
@@ -488,19 +967,31 @@ class GoogleAuth(GoogleAuthBuilder):
                                 number format (which depends on the spreadsheet
                                 locale).
         """
+        _load_pandas()
         method = "sheets:v4.spreadsheets.values.append"
-        if type(values) is pd.core.frame.DataFrame:
-            c = [list(values.columns)] if columns else []
-            values = c + values.fillna("").to_numpy().tolist()
-        
-        build_args = locals()
-        del build_args["self"]
+        if values.__class__ is _DF:
+            values = _df_to_rows(values, columns)
+
+        build_args = {
+            "method": method,
+            "spreadsheetId": spreadsheetId,
+            "range": range,
+            "values": values,
+            "majorDimension": majorDimension,
+            "insertDataOption": insertDataOption,
+            "valueInputOption": valueInputOption,
+            "includeValuesInResponse": includeValuesInResponse,
+            "responseValueRenderOption": responseValueRenderOption,
+            "responseDateTimeRenderOption": responseDateTimeRenderOption,
+            "kwargs": kwargs
+        }
         service_doc, method_doc, method, url, params, body = self.build_params(**build_args)
         response = self.request(method=method, url=url, params=params, body=body)
+        self._sheet_cache_drop(spreadsheetId)
         return response
-    
+
     def get_spreadsheet(self, spreadsheetId, ranges=None, fields=None,
-                        includeGridData=True, **kwargs):
+                        includeGridData=True, preset=None, **kwargs):
         """
         DESCRIPTION:
             Returns the spreadsheet at the given ID. The caller must specify the
@@ -539,14 +1030,32 @@ class GoogleAuth(GoogleAuthBuilder):
             includeGridData: bool
                             True if grid data should be returned. This parameter
                             is ignored if a field mask was set in the request.
+            \n
+            preset: string
+                    Shortcut for a minimal field mask when `fields` is not
+                    set. One of "values" (formatted cell values), "colors"
+                    (cell background colors) or "all" (no mask). Using a
+                    preset also turns `includeGridData` off, since the mask
+                    already selects the grid data wanted.
         """
         method = "sheets:v4.spreadsheets.get"
-        build_args = locals()
-        del build_args["self"]
+        stream = kwargs.pop("stream", False)
+        if fields is None and preset is not None:
+            fields = _GET_SPREADSHEET_PRESETS[preset]
+            includeGridData = False
+        build_args = {
+            "method": method,
+            "spreadsheetId": spreadsheetId,
+            "ranges": ranges,
+            "includeGridData": includeGridData,
+            "kwargs": kwargs
+        }
         service_doc, method_doc, method, url, params, body = self.build_params(**build_args)
         if fields:
             params["fields"] = fields
-        response = self.request(method=method, url=url, params=params, body=body)
+        response = self.request(
+            method=method, url=url, params=params, body=body, stream=stream
+        )
         return response
 
 
@@ -577,57 +1086,98 @@ class GoogleAuth(GoogleAuthBuilder):
                             For more reference:
                             https://developers.google.com/sheets/api/reference/rest/v4/spreadsheets/cells#CellData
         """
-        ranges = [ranges] if type(ranges) is str else list(ranges)
-        valueRenderOption = [valueRenderOption] if type(valueRenderOption) is str else list(valueRenderOption)
-        
+        ranges = _as_list(ranges)
+        valueRenderOption = _as_list(valueRenderOption)
+
+        # Common case: one render option over one range with no metadata.
+        # A single A1 range yields exactly one grid, so the titles, grid
+        # offsets and range bookkeeping below are never needed — ask the API
+        # for just the cell values and return them directly.
+        if (not metadata and len(valueRenderOption) == 1 and len(ranges) == 1
+                and not kwargs.get("raw_output")):
+            v = valueRenderOption[0]
+            fields = f"sheets.data.rowData.values.{v}"
+            response = self.get_spreadsheet(spreadsheetId, ranges, fields=fields)
+            grid = jq_lite(response, f"sheets.data.rowData.values.{v}")[0][0]
+            max_col = max([len(x) for x in grid])
+            if max_col > 1:
+                return grid
+            return [x[0] for x in grid]
+
         fields = f"sheets(properties,data(startRow,startColumn,(rowData(values({','.join(valueRenderOption)})))))"
-        response = self.get_spreadsheet(spreadsheetId, ranges, fields=fields)
 
-        if kwargs.get("raw_output"):
-            return response
-        
-        sheet_titles_q = "sheets.properties.title"
-        sheet_startRows_q = "sheets.data.startRow"
-        sheet_startColumns_q = "sheets.data.startColumn"
-        userEnteredValue_q = "sheets.data.rowData.values.userEnteredValue"
-        effectiveValue_q = "sheets.data.rowData.values.effectiveValue"
-        formattedValue_q = "sheets.data.rowData.values.formattedValue"
-        hyperlink_q = "sheets.data.rowData.values.hyperlink"
-
-        sheet_titles = jq_lite(response, sheet_titles_q)
-        sheet_startRows = jq_lite(response, sheet_startRows_q, 0)
-        sheet_startColumns = jq_lite(response, sheet_startColumns_q, 0)
-        sheet_userEnteredValue = jq_lite(response, userEnteredValue_q)
-        sheet_effectiveValue = jq_lite(response, effectiveValue_q)
-        sheet_formattedValue = jq_lite(response, formattedValue_q)
-        sheet_hyperlink = jq_lite(response, hyperlink_q)
+        if ijson is not None and not kwargs.get("raw_output"):
+            # Fuse parsing and extraction: walk the response one sheet at a
+            # time straight into the output lists, so the full grid is never
+            # materialized as a Python tree.
+            resp = self.get_spreadsheet(
+                spreadsheetId, ranges, fields=fields, stream=True
+            )
+            sheet_titles = []
+            sheet_startRows = []
+            sheet_startColumns = []
+            sheets_by_kind = {v: [] for v in valueRenderOption}
+            # requests leaves the raw stream undecoded; without this ijson
+            # would be fed gzip bytes whenever the server compresses the body.
+            resp.raw.decode_content = True
+            for sheet in ijson.items(resp.raw, "sheets.item", use_float=True):
+                sheet_titles.append((sheet.get("properties") or {}).get("title"))
+                data = sheet.get("data", [])
+                sheet_startRows.append([d.get("startRow", 0) for d in data])
+                sheet_startColumns.append([d.get("startColumn", 0) for d in data])
+                for v in valueRenderOption:
+                    sheets_by_kind[v].append([
+                        [
+                            [cell.get(v) for cell in row.get("values", [])]
+                            for row in d.get("rowData", [])
+                        ]
+                        for d in data
+                    ])
+        else:
+            response = self.get_spreadsheet(spreadsheetId, ranges, fields=fields)
+
+            if kwargs.get("raw_output"):
+                return response
+
+            sheet_titles = jq_lite(response, "sheets.properties.title")
+            sheet_startRows = jq_lite(response, "sheets.data.startRow", 0)
+            sheet_startColumns = jq_lite(response, "sheets.data.startColumn", 0)
+
+            # Each extraction is a full traversal of the response tree, so
+            # only pull the render options the caller actually asked for.
+            sheets_by_kind = {
+                v: jq_lite(response, f"sheets.data.rowData.values.{v}")
+                for v in valueRenderOption
+            }
+        shape_src = sheets_by_kind[valueRenderOption[0]]
 
         sheet_ranges = []
         for i, (cs, rs) in enumerate(zip(sheet_startColumns, sheet_startRows)):
             range_ = []
             for j, (c, r) in enumerate(zip(cs, rs)):
-                max_col = max([len(x) for x in sheet_effectiveValue[i][j]])
-                max_row = len(sheet_effectiveValue[i][j])
+                rlens = [len(x) for x in shape_src[i][j]]
+                max_col = max(rlens)
+                max_row = len(rlens)
                 end_col = c + max_col - 1
                 end_row = r + max_row - 1
-                initial_range = f"{num2letter(c + 1)}{r + 1}"
-                final_range = f"{num2letter(end_col + 1)}{end_row + 1}"
+                initial_range = f"{_COL_LETTERS[c]}{r + 1}"
+                final_range = f"{_COL_LETTERS[end_col]}{end_row + 1}"
                 range_.append(
                     f"'{sheet_titles[i]}'!{initial_range}:{final_range}"
                 )
             sheet_ranges.append(range_)
         
-        sheet_ranges = list(chain(*sheet_ranges))
+        sheet_ranges = list(chain.from_iterable(sheet_ranges))
 
         if not metadata and (len(valueRenderOption) == 1) and (len(sheet_ranges) == 1):
-            result = locals().get("sheet_" + valueRenderOption[0])[0][0]
+            result = shape_src[0][0]
             if max_col > 1:
-                return result 
+                return result
             return [x[0] for x in result]
 
         result = {}
         for v in valueRenderOption:
-            values = list(chain(*locals().get("sheet_" + v)))
+            values = list(chain.from_iterable(sheets_by_kind[v]))
             result[v] = dict(zip(sheet_ranges, values))
 
         return result
@@ -636,26 +1186,33 @@ class GoogleAuth(GoogleAuthBuilder):
         """
         Fetch basic info for the sheets in a spreadsheet.
         """
+        _load_pandas()
         fields = "sheets.properties(sheetId,title,index,sheetType,gridProperties(rowCount,columnCount),hidden)"
         response = self.get_spreadsheet(spreadsheetId, fields=fields)
 
-        outdf = []
-        for i in range(len(response["sheets"])):
-            properties = response["sheets"][i]["properties"]
-            outdf.append(
-                {
-                    "sheetId": properties["sheetId"],
-                    "title": properties["title"],
-                    "index": properties["index"],
-                    "sheetType": properties["sheetType"],
-                    "rowCount": properties["gridProperties"]["rowCount"],
-                    "columnCount": properties["gridProperties"]["columnCount"],
-                    "hidden": properties.get("hidden", False)
-                }
-            )
-
-        outdf = pd.DataFrame(outdf)
-        return outdf
+        # Build the columns directly so pandas gets one block per column
+        # instead of inferring types from a list of per-sheet dicts.
+        sheetId, title, index = [], [], []
+        sheetType, rowCount, columnCount, hidden = [], [], [], []
+        for sheet in response["sheets"]:
+            properties = sheet["properties"]
+            sheetId.append(properties["sheetId"])
+            title.append(properties["title"])
+            index.append(properties["index"])
+            sheetType.append(properties["sheetType"])
+            rowCount.append(properties["gridProperties"]["rowCount"])
+            columnCount.append(properties["gridProperties"]["columnCount"])
+            hidden.append(properties.get("hidden", False))
+
+        return pd.DataFrame({
+            "sheetId": sheetId,
+            "title": title,
+            "index": index,
+            "sheetType": sheetType,
+            "rowCount": rowCount,
+            "columnCount": columnCount,
+            "hidden": hidden
+        })
     
 
     def batch_update_spreadsheet(self, spreadsheetId, requests,
@@ -709,12 +1266,20 @@ class GoogleAuth(GoogleAuthBuilder):
                                     set in the request.
         """
         method = "sheets:v4.spreadsheets.batchUpdate"
-        build_args = locals()
-        del build_args["self"]
+        build_args = {
+            "method": method,
+            "spreadsheetId": spreadsheetId,
+            "requests": requests,
+            "includeSpreadsheetInResponse": includeSpreadsheetInResponse,
+            "responseRanges": responseRanges,
+            "responseIncludeGridData": responseIncludeGridData,
+            "kwargs": kwargs
+        }
         service_doc, method_doc, method, url, params, body = self.build_params(**build_args)
         if kwargs.get("fields"):
             params["fields"] = kwargs.get("fields")
         response = self.request(method=method, url=url, params=params, body=body)
+        self._sheet_cache_drop(spreadsheetId)
         return response
     
 
@@ -759,14 +1324,18 @@ class GoogleAuth(GoogleAuthBuilder):
         
         properties["timeZone"] = kwargs.get("timeZone", "GMT")
 
-        sheet_titles = [sheet_titles] if type(sheet_titles) is str else sheet_titles
+        sheet_titles = _as_list(sheet_titles) if sheet_titles else []
         sheets = []
         if sheet_titles:
             for i, x in enumerate(sheet_titles):
                 sheets.append({"properties": {"title": x, "index": i}})
 
-        build_args = locals()
-        del build_args["self"]
+        build_args = {
+            "method": method,
+            "properties": properties,
+            "sheets": sheets,
+            "kwargs": kwargs
+        }
         service_doc, method_doc, method, url, params, body = self.build_params(**build_args)
         response = self.request(method=method, url=url, params=params, body=body)
 
@@ -791,6 +1360,7 @@ class GoogleAuth(GoogleAuthBuilder):
             vids: string[]
                 Return videos with the given ids.
         """
+        _load_pandas()
         method = "youtube:v3.videos.list"
 
         parts = [
@@ -801,65 +1371,73 @@ class GoogleAuth(GoogleAuthBuilder):
         parts = kwargs.get("parts", parts)
         
         part = ",".join(parts)
-        maxResults=50
-        build_args = locals()
-        del build_args["self"]
+        maxResults = 50
+        build_args = {
+            "method": method,
+            "part": part,
+            "maxResults": maxResults,
+            "kwargs": kwargs
+        }
         service_doc, method_doc, method, url, params, body = self.build_params(**build_args)
         
-        vids = pd.Series(vids)
-        raw_vids = list(vids.copy())
-        vids = list(vids[vids.fillna("").str.match("([-_A-Za-z0-9]{11})")].unique())
-        vids = np.array_split(vids, np.ceil(len(vids) / 50))
-        items = []
-        for vid in vids:
-            params["id"] = ','.join(vid)
-            response = self.request(method=method, url=url, params=params, body=body)
-            items += response["items"]
-
-        if kwargs.get("raw_output"):
-            return {"kind": response["kind"], "items": items}
-
-        cols = {
-            "kind": "kind",
-            "id": "id",
-            "publishedAt": "snippet.publishedAt",
-            "channelId": "snippet.channelId",
-            "title": "snippet.title",
-            "description": "snippet.description",
-            "channelTitle": "snippet.channelTitle",
-            "categoryId": "snippet.categoryId",
-            "tags": "snippet.tags",
-            "defaultLanguage": "snippet.defaultLanguage",
-            "defaultAudioLanguage": "snippet.defaultAudioLanguage",
-            "duration": "contentDetails.duration",
-            "viewCount": "statistics.viewCount",
-            "likeCount": "statistics.likeCount",
-            "favoriteCount": "statistics.favoriteCount",
-            "commentCount": "statistics.commentCount",
-            "topicIds": "topicDetails.topicIds",
-            "topicCategories": "topicDetails.topicCategories"
-        }
-
-        result = pd.DataFrame(dict(zip(
-            cols.keys(), 
-            [jq_lite(items, x) for x in cols.values()]
-        )))
-        result["viewCount"] = result["viewCount"].astype(float)
-        result["likeCount"] = result["likeCount"].astype(float)
-        result["favoriteCount"] = result["favoriteCount"].astype(float)
-        result["commentCount"] = result["commentCount"].astype(float)
-
-        empty_row = dict(zip(
-            list(result.columns), 
-            [None for x in range(len(cols))]
+        raw_vids = _as_list(vids)
+        vids = list(dict.fromkeys(
+            v for v in raw_vids if isinstance(v, str) and _YT_VID_ID_RE.match(v)
         ))
-        result = pd.concat([result, pd.DataFrame([empty_row])]).reset_index(drop=True)
+        batches = [','.join(vids[i:i + 50]) for i in range(0, len(vids), 50)]
+
+        def _fetch_batch(id_csv):
+            p = dict(params)
+            p["id"] = id_csv
+            return self.request(method=method, url=url, params=p, body=body)
+
+        # The id batches are independent requests, so overlap their round
+        # trips; a bounded pool keeps us well within YouTube's QPS limits.
+        if len(batches) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(batches))) as ex:
+                responses = list(ex.map(_fetch_batch, batches))
+        else:
+            responses = [_fetch_batch(b) for b in batches]
+        items = list(chain.from_iterable(r["items"] for r in responses))
 
-        idx = [list(result["id"]).index(x) if x in list(result["id"]) else
-            result.shape[0] - 1 for x in raw_vids]
-        result = result.iloc[idx]
-        result["id"] = raw_vids
-        return result.reset_index(drop=True)
+        if kwargs.get("raw_output"):
+            kind = responses[0]["kind"] if responses else "youtube#videoListResponse"
+            return {"kind": kind, "items": items}
+
+        # One pass over the items instead of one full jq_lite traversal per
+        # column; the sub-dicts are resolved once per item and each column
+        # is built straight from them, already in raw_vids order, so no
+        # concat/iloc reindex pass is needed afterwards.
+        by_id = {x.get("id"): x for x in items}
+        ordered = [by_id.get(r, {}) for r in raw_vids]
+        snippet = [x.get("snippet") or {} for x in ordered]
+        content = [x.get("contentDetails") or {} for x in ordered]
+        stats = [x.get("statistics") or {} for x in ordered]
+        topics = [x.get("topicDetails") or {} for x in ordered]
+
+        result = pd.DataFrame({
+            "kind": [x.get("kind") for x in ordered],
+            "id": raw_vids,
+            "publishedAt": [s.get("publishedAt") for s in snippet],
+            "channelId": [s.get("channelId") for s in snippet],
+            "title": [s.get("title") for s in snippet],
+            "description": [s.get("description") for s in snippet],
+            "channelTitle": [s.get("channelTitle") for s in snippet],
+            "categoryId": [s.get("categoryId") for s in snippet],
+            "tags": [s.get("tags") for s in snippet],
+            "defaultLanguage": [s.get("defaultLanguage") for s in snippet],
+            "defaultAudioLanguage": [s.get("defaultAudioLanguage") for s in snippet],
+            "duration": [c.get("duration") for c in content],
+            "viewCount": [s.get("viewCount") for s in stats],
+            "likeCount": [s.get("likeCount") for s in stats],
+            "favoriteCount": [s.get("favoriteCount") for s in stats],
+            "commentCount": [s.get("commentCount") for s in stats],
+            "topicIds": [t.get("topicIds") for t in topics],
+            "topicCategories": [t.get("topicCategories") for t in topics]
+        })
+        for col in ("viewCount", "likeCount", "favoriteCount", "commentCount"):
+            result[col] = pd.to_numeric(result[col], errors="coerce")
+        return result
 
 
     def list_channels(self, cids, **kwargs):
@@ -878,6 +1456,7 @@ class GoogleAuth(GoogleAuthBuilder):
             cids: string[]
                 Return the channels with the specified IDs.
         """
+        _load_pandas()
         method = "youtube:v3.channels.list"
         parts = [
             "brandingSettings", "contentDetails",
@@ -887,60 +1466,68 @@ class GoogleAuth(GoogleAuthBuilder):
         parts = kwargs.get("parts", parts)
         
         part = ",".join(parts)
-        maxResults=50
-        build_args = locals()
-        del build_args["self"]
+        maxResults = 50
+        build_args = {
+            "method": method,
+            "part": part,
+            "maxResults": maxResults,
+            "kwargs": kwargs
+        }
         service_doc, method_doc, method, url, params, body = self.build_params(**build_args)
         
-        cids = pd.Series(cids)
-        raw_cids = list(cids.copy())
-        cids = list(cids[cids.fillna("").str.match("([-_A-Za-z0-9]{11})")].unique())
-        cids = np.array_split(cids, np.ceil(len(cids) / 50))
-        items = []
-        for cid in cids:
-            params["id"] = ','.join(cid)
-            response = self.request(method=method, url=url, params=params, body=body)
-            items += response["items"]
+        raw_cids = _as_list(cids)
+        cids = list(dict.fromkeys(
+            c for c in raw_cids if isinstance(c, str) and _YT_CID_ID_RE.match(c)
+        ))
+        batches = [','.join(cids[i:i + 50]) for i in range(0, len(cids), 50)]
 
-        if kwargs.get("raw_output"):
-            return {"kind": response["kind"], "items": items}
-        
-        cols = {
-            "kind": "kind",
-            "id": "id",
-            "title": "snippet.title",
-            "description": "snippet.description",
-            "customUrl": "snippet.customUrl",
-            "publishedAt": "snippet.publishedAt",
-            "country": "snippet.country",
-            "uploads": "contentDetails.relatedPlaylists.uploads",
-            "viewCount": "statistics.viewCount",
-            "subscriberCount": "statistics.subscriberCount",
-            "hiddenSubscriberCount": "statistics.hiddenSubscriberCount",
-            "videoCount": "statistics.videoCount",
-            "topicIds": "topicDetails.topicIds",
-            "topicCategories": "topicDetails.topicCategories"
-        }
+        def _fetch_batch(id_csv):
+            p = dict(params)
+            p["id"] = id_csv
+            return self.request(method=method, url=url, params=p, body=body)
 
-        result = pd.DataFrame(dict(zip(
-            cols.keys(), 
-            [jq_lite(items, x) for x in cols.values()]
-        )))
-        result["viewCount"] = result["viewCount"].astype(float)
-        result["subscriberCount"] = result["subscriberCount"].astype(float)
-        result["videoCount"] = result["videoCount"].astype(float)
-
-        empty_row = dict(zip(
-            list(result.columns), 
-            [None for x in range(len(cols))]
-        ))
-        result = pd.concat([result, pd.DataFrame([empty_row])]).reset_index(drop=True)
+        if len(batches) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(batches))) as ex:
+                responses = list(ex.map(_fetch_batch, batches))
+        else:
+            responses = [_fetch_batch(b) for b in batches]
+        items = list(chain.from_iterable(r["items"] for r in responses))
 
-        idx = [list(result["id"]).index(x) if x in list(result["id"]) else
-            result.shape[0] - 1 for x in raw_cids]
-        result = result.iloc[idx]
-        result["id"] = raw_cids
-        return result.reset_index(drop=True)
+        if kwargs.get("raw_output"):
+            kind = responses[0]["kind"] if responses else "youtube#channelListResponse"
+            return {"kind": kind, "items": items}
+        
+        # Single traversal of the items, mirroring list_videos; columns are
+        # built straight in raw_cids order.
+        by_id = {x.get("id"): x for x in items}
+        ordered = [by_id.get(r, {}) for r in raw_cids]
+        snippet = [x.get("snippet") or {} for x in ordered]
+        content = [x.get("contentDetails") or {} for x in ordered]
+        stats = [x.get("statistics") or {} for x in ordered]
+        topics = [x.get("topicDetails") or {} for x in ordered]
+
+        result = pd.DataFrame({
+            "kind": [x.get("kind") for x in ordered],
+            "id": raw_cids,
+            "title": [s.get("title") for s in snippet],
+            "description": [s.get("description") for s in snippet],
+            "customUrl": [s.get("customUrl") for s in snippet],
+            "publishedAt": [s.get("publishedAt") for s in snippet],
+            "country": [s.get("country") for s in snippet],
+            "uploads": [
+                (c.get("relatedPlaylists") or {}).get("uploads")
+                for c in content
+            ],
+            "viewCount": [s.get("viewCount") for s in stats],
+            "subscriberCount": [s.get("subscriberCount") for s in stats],
+            "hiddenSubscriberCount": [s.get("hiddenSubscriberCount") for s in stats],
+            "videoCount": [s.get("videoCount") for s in stats],
+            "topicIds": [t.get("topicIds") for t in topics],
+            "topicCategories": [t.get("topicCategories") for t in topics]
+        })
+        for col in ("viewCount", "subscriberCount", "videoCount"):
+            result[col] = pd.to_numeric(result[col], errors="coerce")
+        return result
     
 
     def list_playlist_items(self, playlistId, parts=None, pageToken=None, **kwargs):
@@ -964,11 +1551,17 @@ class GoogleAuth(GoogleAuthBuilder):
         """
         method = "youtube:v3.playlistItems.list"
         parts = parts or ["contentDetails", "id", "snippet", "status"]
-        
+
         part = ",".join(parts)
-        maxResults=50
-        build_args = locals()
-        del build_args["self"]
+        maxResults = 50
+        build_args = {
+            "method": method,
+            "playlistId": playlistId,
+            "part": part,
+            "maxResults": maxResults,
+            "pageToken": pageToken,
+            "kwargs": kwargs
+        }
         service_doc, method_doc, method, url, params, body = self.build_params(**build_args)
         response = self.request(method=method, url=url, params=params, body=body)
         return response
@@ -980,6 +1573,7 @@ class GoogleAuth(GoogleAuthBuilder):
 
         date: "YYYY-MM-DDTHH:mm:ssZ"
         """
+        _load_pandas()
         if not include:
             d = datetime.strptime(date, "%Y-%m-%dT%H:%M:%SZ")
             d = d - timedelta(seconds=1)
@@ -990,25 +1584,20 @@ class GoogleAuth(GoogleAuthBuilder):
         items = []
         while cum_k < k:
             response = self.list_playlist_items(playlistId, pageToken=nextPageToken)
-            items = items + response["items"]
-            items_dates = [x["contentDetails"]["videoPublishedAt"] for x in items]
+            page = response["items"]
+            items += page
             nextPageToken = response.get("nextPageToken")
-            cum_k = sum([x <= date for x in items_dates]) if nextPageToken else k
-
-        cols = {
-            "id": "id",
-            "channelId": "snippet.channelId",
-            "videoId": "contentDetails.videoId",
-            "publishedAt": "contentDetails.videoPublishedAt",
-            "title": "snippet.title",
-            "description": "snippet.description",
-            "channelTitle": "snippet.channelTitle"
-        }
+            if not nextPageToken:
+                break
+            # Earlier pages are already counted, so only the new page's
+            # publish dates need checking.
+            cum_k += sum(
+                x["contentDetails"]["videoPublishedAt"] <= date for x in page
+            )
 
-        result = pd.DataFrame(dict(zip(
-            cols.keys(), 
-            [jq_lite(items, x) for x in cols.values()]
-        )))
+        result = pd.DataFrame({
+            k: jq_lite(items, path) for k, path in _PLAYLISTITEM_COLS
+        })
 
         result = result[result["publishedAt"] < date].sort_values(
             "publishedAt", ascending=False
@@ -1057,8 +1646,15 @@ class GoogleAuth(GoogleAuthBuilder):
                     and shared drives.
         """
         method = "drive:v3.files.list"
-        build_args = locals()
-        del build_args["self"]
+        build_args = {
+            "method": method,
+            "q": q,
+            "corpora": corpora,
+            "includeItemsFromAllDrives": includeItemsFromAllDrives,
+            "supportsAllDrives": supportsAllDrives,
+            "pageSize": pageSize,
+            "kwargs": kwargs
+        }
         service_doc, method_doc, method, url, params, body = self.build_params(**build_args)
         if fields:
             params["fields"] = fields
@@ -1073,6 +1669,7 @@ class GoogleAuth(GoogleAuthBuilder):
         See more from 
         https://developers.google.com/drive/api/guides/search-files#examples
         """
+        _load_pandas()
         fields = fields or [
             "driveId", "id", "name", "mimeType", "createdTime", 
             "modifiedTime", "size", "md5Checksum", "owners(emailAddress)", "trashed"
@@ -1115,10 +1712,15 @@ class GoogleAuth(GoogleAuthBuilder):
         """
         method = "drive:v3.files.copy"
         supportsAllDrives = kwargs.get("supportsAllDrives", True)
+        build_args = {
+            "method": method,
+            "fileId": fileId,
+            "name": name,
+            "supportsAllDrives": supportsAllDrives,
+            "kwargs": kwargs
+        }
         if folderId:
-            parents = [folderId]
-        build_args = locals()
-        del build_args["self"]
+            build_args["parents"] = [folderId]
         service_doc, method_doc, method, url, params, body = self.build_params(**build_args)
         fields = fields or [
             "driveId", "id", "name", "mimeType", "createdTime", "modifiedTime", "size",
@@ -1127,8 +1729,17 @@ class GoogleAuth(GoogleAuthBuilder):
         fields = ','.join(fields)
         params["fields"] = fields
         response = self.request(method=method, url=url, params=params, body=body)
+        self._remember_parents(response)
         return response
-    
+
+    def _remember_parents(self, response):
+        """
+        Cache the parents returned with a file resource so a later mv can
+        skip its lookup round trip.
+        """
+        if type(response) is dict and response.get("id") and "parents" in response:
+            self._parent_cache[response["id"]] = response["parents"]
+
     def findone(self, fileId, fields=None, **kwargs):
         """
         DESCRIPTION:
@@ -1152,8 +1763,11 @@ class GoogleAuth(GoogleAuthBuilder):
                     response.
         """
         method = "drive:v3.files.get"
-        build_args = locals()
-        del build_args["self"]
+        build_args = {
+            "method": method,
+            "fileId": fileId,
+            "kwargs": kwargs
+        }
         service_doc, method_doc, method, url, params, body = self.build_params(**build_args)
         fields = fields or [
             "driveId", "id", "name", "mimeType", "createdTime", "modifiedTime", "size",
@@ -1162,6 +1776,7 @@ class GoogleAuth(GoogleAuthBuilder):
         fields = ','.join(fields)
         params["fields"] = fields
         response = self.request(method=method, url=url, params=params, body=body)
+        self._remember_parents(response)
         return response
 
 
@@ -1183,12 +1798,64 @@ class GoogleAuth(GoogleAuthBuilder):
                     The ID of the file.
         """
         method = "drive:v3.files.delete"
-        build_args = locals()
-        del build_args["self"]
+        build_args = {
+            "method": method,
+            "fileId": fileId,
+            "kwargs": kwargs
+        }
         service_doc, method_doc, method, url, params, body = self.build_params(**build_args)
+        self._parent_cache.pop(fileId, None)
         return self.request(method=method, url=url, params=params, body=body)
 
 
+    def batch(self, subrequests, **kwargs):
+        """
+        DESCRIPTION:
+            Sends up to 100 Drive API calls in one multipart/mixed request to
+            the batch endpoint, saving an HTTP round trip per call. Each
+            subrequest is a dict with "method" and "url" (a path such as
+            "/drive/v3/files/xxx?fields=parents") and an optional "body".
+            Returns the decoded JSON payload of each part in order; parts
+            without a payload yield None. Sub-requests must be independent:
+            a part cannot reference another part's response.
+        \n\n
+        PARAMETERS:
+            subrequests: dict[]
+                    The calls to bundle, e.g.
+                    {"method": "DELETE", "url": "/drive/v3/files/xxx"}.
+        """
+        boundary = "batch_" + uuid4().hex
+        parts = []
+        for i, sub in enumerate(subrequests):
+            inner = f"{sub['method'].upper()} {sub['url']} HTTP/1.1\r\n"
+            if sub.get("body") is not None:
+                payload = _json_dumps(sub["body"])
+                inner += "Content-Type: application/json; charset=UTF-8\r\n"
+                # Content-Length counts the encoded bytes, not characters.
+                inner += f"Content-Length: {len(payload)}\r\n\r\n"
+                inner += payload.decode()
+            else:
+                inner += "\r\n"
+            parts.append(
+                f"--{boundary}\r\nContent-Type: application/http\r\n"
+                f"Content-ID: <item{i + 1}>\r\n\r\n{inner}\r\n"
+            )
+        data = ("".join(parts) + f"--{boundary}--\r\n").encode("utf-8")
+        response = self._get_client().request(
+            method="POST",
+            url="https://www.googleapis.com/batch/drive/v3",
+            headers={
+                **self.headers,
+                "Content-Type": f"multipart/mixed; boundary={boundary}"
+            },
+            data=data
+        )
+        if not response.ok:
+            print(response.text)
+            response.raise_for_status()
+        return _parse_batch_response(response)
+
+
     def credate_gdrive_files(self, fileId=None, uploadType=None, fields=None, **kwargs):
         """
         Generic API call to create or update a file
@@ -1199,8 +1866,12 @@ class GoogleAuth(GoogleAuthBuilder):
             "md5Checksum", "parents"
         ]
         fields = ','.join(fields)
-        build_args = locals()
-        del build_args["self"]
+        build_args = {
+            "method": method,
+            "fileId": fileId,
+            "uploadType": uploadType,
+            "kwargs": kwargs
+        }
         service_doc, method_doc, method, url, params, body = self.build_params(**build_args)
         params["fields"] = fields
         if kwargs.get("files"):
@@ -1208,7 +1879,9 @@ class GoogleAuth(GoogleAuthBuilder):
             url = url + f"/{fileId}" if fileId else url
             params["uploadType"] = uploadType
             body = None
-        return self.request(method=method, url=url, params=params, body=body, files=kwargs.get("files"))
+        response = self.request(method=method, url=url, params=params, body=body, files=kwargs.get("files"))
+        self._remember_parents(response)
+        return response
 
     def ln(self, targetId, name=None, folderId=None, fields=None, **kwargs):
         """
@@ -1222,7 +1895,7 @@ class GoogleAuth(GoogleAuthBuilder):
             "shortcutDetails": shortcutDetails,
             'mimeType': 'application/vnd.google-apps.shortcut',
             "name": name,
-            "parents": [folderId] if type(folderId) is str else folderId,
+            "parents": _as_list(folderId),
             "fields": fields,
             **kwargs
         }
@@ -1236,24 +1909,33 @@ class GoogleAuth(GoogleAuthBuilder):
         folderId = folderId or "root"
         args = {
             "name": folderName,
-            "parents": [folderId] if type(folderId) is str else folderId,
+            "parents": _as_list(folderId),
             "fields": fields,
             "mimeType": "application/vnd.google-apps.folder",
             **kwargs
         }
         return self.credate_gdrive_files(**args)
     
-    def mv(self, fileId, folderId, fields=None, **kwargs):
+    def mv(self, fileId, folderId, fields=None, currentParents=None, **kwargs):
         """
-        Move a file
+        Move a file. `currentParents` lets the caller skip the parent
+        lookup; otherwise a parent list cached from an earlier response is
+        used before falling back to the extra findone round trip.
         """
+        if currentParents is None:
+            currentParents = self._parent_cache.get(fileId)
+        if currentParents is None:
+            currentParents = self.findone(fileId, ["parents"])["parents"]
         args = {
             "fileId": fileId,
-            "removeParents": self.findone(fileId, ["parents"])["parents"],
+            "removeParents": currentParents,
             "addParents": folderId,
             "fields": fields,
             **kwargs
         }
+        # The move invalidates the cached parents; the update response
+        # repopulates them when its field mask includes "parents".
+        self._parent_cache.pop(fileId, None)
         return self.credate_gdrive_files(**args)
     
     def upload_file(self, fpath, name=None, fileId=None, folderId=None, mimeType=None, 
@@ -1263,20 +1945,23 @@ class GoogleAuth(GoogleAuthBuilder):
         """
         metadata = metadata or dict()
         folderId = folderId or "root"
-        folderId = [folderId] if type(folderId) is str else folderId
+        folderId = _as_list(folderId)
         uploadType = "multipart"
         
         if type(fpath) is str and mimeType is None:
-            _, ext = os.path.splitext(fpath)
-            try:
-                mimeType = mimetypes.types_map[ext]
-            except Exception:
-                mimeType = None
+            mimeType = _guess_mime(os.path.splitext(fpath)[1])
 
         if type(fpath) is str:
             name = name or os.path.split(fpath)[-1]
             with open(fpath, "rb") as f:
-                fpath = f.read()
+                try:
+                    # Map the file instead of read()ing it: the OS pages it
+                    # in on demand, so peak memory stays flat regardless of
+                    # file size. The mapping outlives the closed handle.
+                    fpath = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except ValueError:
+                    # Zero-length files cannot be mapped.
+                    fpath = f.read()
         elif type(fpath) is io.BytesIO:
             fpath = fpath.getvalue()
 
@@ -1292,9 +1977,21 @@ class GoogleAuth(GoogleAuthBuilder):
             else:
                 metadata["removeParents"] = self.findone(fileId, ["parents"])["parents"]
                 metadata["addParents"] = folderId
-        
+
+        # Above 5 MiB switch to a resumable session: chunks can be retried
+        # without re-sending the whole file, and nothing is duplicated in
+        # memory for the multipart envelope.
+        if len(fpath) > 5 * 1024 * 1024:
+            try:
+                return self._upload_resumable(
+                    fpath, metadata, fileId=fileId, fields=fields, **kwargs
+                )
+            finally:
+                if type(fpath) is mmap.mmap:
+                    fpath.close()
+
         files = {
-            "data": ("metadata", json.dumps(metadata), "application/json; charset=UTF-8"),
+            "data": ("metadata", _json_dumps(metadata), "application/json; charset=UTF-8"),
             "file": fpath
         }
 
@@ -1308,26 +2005,102 @@ class GoogleAuth(GoogleAuthBuilder):
         if fileId:
             args["fileId"] = fileId
 
-        return self.credate_gdrive_files(**args)
+        try:
+            return self.credate_gdrive_files(**args)
+        finally:
+            if type(fpath) is mmap.mmap:
+                fpath.close()
     
 
+    def _upload_resumable(self, data, metadata, fileId=None, fields=None,
+                          chunk_size=8 * 1024 * 1024, **kwargs):
+        """
+        Upload `data` through a Drive resumable session: one initiation
+        request carrying the metadata, then Content-Range chunks PUT to the
+        session URL. A failed chunk can be retried without re-transmitting
+        the earlier ones. The field mask defaults to the same list as
+        `credate_gdrive_files`, so `upload_file` returns the same response
+        shape on both sides of the 5 MiB boundary.
+        """
+        url = "https://www.googleapis.com/upload/drive/v3/files"
+        http_method = "PATCH" if fileId else "POST"
+        if fileId:
+            url = url + f"/{fileId}"
+        fields = fields or [
+            "driveId", "id", "name", "mimeType", "createdTime", "size",
+            "md5Checksum", "parents"
+        ]
+        # Extra query parameters (e.g. supportsAllDrives) ride along like
+        # they do on the multipart path.
+        params = {"uploadType": "resumable", "fields": ','.join(fields), **kwargs}
+        # On updates the parent changes travel as query parameters, not in
+        # the metadata body.
+        for k in ("addParents", "removeParents"):
+            if k in metadata:
+                v = metadata.pop(k)
+                params[k] = ",".join(v) if type(v) is list else v
+
+        session = self._get_client()
+        response = session.request(
+            http_method, url, params=params,
+            headers={
+                **self.headers,
+                "Content-Type": "application/json; charset=UTF-8"
+            },
+            data=_json_dumps(metadata)
+        )
+        if not response.ok:
+            print(response.text)
+            response.raise_for_status()
+        location = response.headers["Location"]
+
+        size = len(data)
+        start = 0
+        result = None
+        while start < size:
+            end = min(start + chunk_size, size)
+            response = session.put(
+                location,
+                data=data[start:end],
+                headers={
+                    "Content-Length": str(end - start),
+                    "Content-Range": f"bytes {start}-{end - 1}/{size}"
+                }
+            )
+            # 308 acknowledges an intermediate chunk; the last chunk
+            # returns the file resource.
+            if response.status_code in (200, 201):
+                result = response.json()
+            elif response.status_code != 308:
+                print(response.text)
+                response.raise_for_status()
+            start = end
+        self._remember_parents(result)
+        return result
+
+
     def download_file(self, fileId, path=None, **kwargs):
         """
-        Download a file
+        Download a file. The body is streamed in 64 KiB chunks, so peak
+        memory stays bounded no matter how large the file is.
         """
         url = f"https://www.googleapis.com/drive/v3/files/{fileId}?alt=media&source=downloadUrl"
-        response = request("GET", url, headers=self.headers)
+        response = _SESSION.request("GET", url, headers=self.headers, stream=True)
 
         if not response.ok:
             print(response.content.decode("utf-8"))
             response.raise_for_status()
-        
+
         if path:
             with open(path, "wb") as f:
-                f.write(response.content)
-                return None 
-        
-        file = io.BytesIO(response.content)
+                for chunk in response.iter_content(chunk_size=1 << 16):
+                    f.write(chunk)
+            return None
+
+        file = io.BytesIO()
+        for chunk in response.iter_content(chunk_size=1 << 16):
+            file.write(chunk)
+        file.seek(0)
         return file
     
 
@@ -1414,11 +2187,25 @@ def yt_vid_from_vurl(x):
     Reference:
         https://gist.github.com/rodrigoborgesdeoliveira/987683cfbfcc8d800192da1e73adc486
     """
-    x = pd.Series(x)
-    output = x.str.extract("(?:youtube(?:-nocookie)*\.com.*(?:vi*=|vi*%3D|/(?:embed|vi*|e|shorts|u/\d+)/)|youtu\.be/)([A-z0-9-_]{11})(?:[%#?&/\s]|$)")[0]
-    output = list(output.where(output.notnull(), [None]))
-    output = output[0] if len(output) == 1 else output
-    return output
+    if isinstance(x, str):
+        m = _YT_VID_RE.search(x)
+        return m.group(1) if m else None
+    x = _as_list(x)
+    # URL columns routinely carry None/NaN entries; map them to None like
+    # Series.str.extract did instead of raising from the regex engine.
+    if _YT_VID_RE2 is not None and len(x) > 10_000:
+        def search(u):
+            return _YT_VID_RE2.search(u) if isinstance(u, str) else None
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as ex:
+            matches = list(ex.map(search, x))
+        output = [m.group(1) if m else None for m in matches]
+    else:
+        output = [
+            m.group(1)
+            if isinstance(u, str) and (m := _YT_VID_RE.search(u)) else None
+            for u in x
+        ]
+    return output[0] if len(output) == 1 else output
 
 
 def yt_cid_from_curl(urls, headers=None, cookies=None):
@@ -1433,9 +2220,7 @@ def yt_cid_from_curl(urls, headers=None, cookies=None):
         "https://www.youtube.com/user/THiNKmediaTV/"
     ]
     """
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    urls = [urls] if type(urls) is str else urls
+    urls = _as_list(urls)
     cookies = cookies or {"CONSENT": "YES+yt.463627267.en-GB+FX+553"} 
     if headers is None:
         headers = {
@@ -1444,41 +2229,54 @@ def yt_cid_from_curl(urls, headers=None, cookies=None):
             'connection': 'keep-alive', 
             'user-agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_1) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/110.0.5400.117 Safari/537.36'
         }
-    channel_id_re = re.compile(".*youtube\\.com/channel/([-_0-9A-z]{24}).*")
-    external_id_re = re.compile('[\w\W]*"(?:externalChannelId|externalId)":"([A-z0-9-_]{24})"')
-    sem = asyncio.Semaphore(50)
+    sem = _Admission(50)
 
     async def fetch_channel_id(client, url):
         async with sem:
-            result = channel_id_re.match(url)
+            result = _URL_CID.search(url)
             if result:
                 return result.group(1)
-            
-            client.cookies = cookies
-            client.headers = headers
-            response = await client.get(url, follow_redirects=True)
+
+            response = await client.get(url)
+            if response.status_code == 429:
+                await sem.throttle()
 
             if not response.is_success:
                 url = url.replace("/c/", "/")
-                response = await client.get(url, follow_redirects=True)
-            
-            result = external_id_re.match(response.text)
+                response = await client.get(url)
+                if response.status_code == 429:
+                    await sem.throttle()
+
+            if response.is_success:
+                await sem.expand()
+
+            result = _HTML_CID.search(response.text)
             if result:
                 return result.group(1)
             return None
 
     async def main():
-        async with httpx.AsyncClient() as client:
-            client.timeout = 10
+        # Configure the client once at construction; HTTP/2 multiplexes the
+        # youtube.com fetches over a handful of pooled connections instead
+        # of one TCP+TLS handshake per url.
+        async with httpx.AsyncClient(
+            http2=True,
+            headers=headers,
+            cookies=cookies,
+            timeout=10,
+            limits=httpx.Limits(
+                max_keepalive_connections=50, max_connections=100
+            ),
+            follow_redirects=True
+        ) as client:
             tasks = []
             for url in urls:
                 tasks.append(asyncio.create_task(fetch_channel_id(client, url)))
-            
+
             result = await asyncio.gather(*tasks)
         return result
     
     result = asyncio.run(main())
     result = result[0] if len(urls) == 1 else result
-    loop.close()
     return result
 
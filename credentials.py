@@ -1,9 +1,40 @@
-import requests 
-import jwt 
+import requests
+import jwt
 from time import time
-import os 
+import os
 import json
 
+try:
+    from cryptography.hazmat.primitives.serialization import load_pem_private_key
+except ImportError:
+    load_pem_private_key = None
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+# Parsed service-account keys by private_key_id; PyJWT accepts the key
+# object directly, so the PEM is only parsed once per key instead of on
+# every token refresh.
+_KEY_CACHE = dict()
+
+# One pooled session for every module-level HTTP call (token refreshes,
+# discovery lookups, raw downloads): connections are reused instead of
+# paying a TCP+TLS handshake per call, and transient failures are retried
+# with backoff.
+_SESSION = requests.Session()
+_SESSION.mount("https://", requests.adapters.HTTPAdapter(
+    pool_connections=50,
+    pool_maxsize=100,
+    max_retries=requests.adapters.Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=(429, 500, 502, 503, 504)
+    )
+))
+
 
 def oauth_refresh(acc_secret):
     """
@@ -29,11 +60,11 @@ def oauth_refresh(acc_secret):
         "refresh_token": acc_secret["refresh_token"],
         "grant_type": "refresh_token"
     }
-    res = requests.post(url, json=body)
+    res = _SESSION.post(url, json=body)
     if not res.ok:
         print(json.dumps(res.json(), indent=4))
         res.raise_for_status()
-    return res.json()
+    return _loads(res.content)
 
 
 def oauth_service(acc_secret, scopes):
@@ -68,8 +99,17 @@ def oauth_service(acc_secret, scopes):
 
     headers = {'kid': acc_secret["private_key_id"]}
 
+    key = acc_secret["private_key"]
+    if load_pem_private_key is not None:
+        key_id = acc_secret["private_key_id"]
+        if key_id not in _KEY_CACHE:
+            _KEY_CACHE[key_id] = load_pem_private_key(
+                key.encode(), password=None
+            )
+        key = _KEY_CACHE[key_id]
+
     signed_jwt = jwt.encode(
-        payload, acc_secret["private_key"], headers=headers, algorithm='RS256'
+        payload, key, headers=headers, algorithm='RS256'
     )
 
     body = {
@@ -77,11 +117,11 @@ def oauth_service(acc_secret, scopes):
         "assertion": signed_jwt
     }
     
-    res = requests.post(url, json=body)
+    res = _SESSION.post(url, json=body)
     if not res.ok:
         print(json.dumps(res.json(), indent=4))
         res.raise_for_status()
-    return res.json()
+    return _loads(res.content)
 
 
 class Credential:
@@ -119,6 +159,8 @@ class Credential:
 
         self._acc_secret = acc_secret
         self._expiry = time()
+        self._cached_headers = None
+        self._cached_headers_expiry = 0
         if "client_email" in acc_secret:
             self._cred_type = "service_account"
             self._scopes = [
@@ -135,7 +177,8 @@ class Credential:
             self._cred_type = "api_key"
             self._scopes = []
             self._oauth_response = {"access_token": acc_secret}
-            self._expiry = time() + time()
+            # API keys never expire, so refresh() has nothing to re-check.
+            self._expiry = float("inf")
         
         self.refresh()
 
@@ -151,6 +194,7 @@ class Credential:
                 self._oauth_response = oauth_refresh(self._acc_secret)
                 self._scopes = self._oauth_response["scope"].split(" ")
                 self._expiry = time() + self._oauth_response["expires_in"] * 0.97
+            self._cached_headers = None
     
     @property
     def token(self):
@@ -159,8 +203,23 @@ class Credential:
 
     @property
     def headers(self):
-        self.refresh()
-        return {"Authorization": f"{self.token_type} {self.token}"}
+        # Rebuilt only when the token changes; every API request reads this
+        # property, so it must not re-derive the dict per call.
+        if self._cached_headers is None or time() > self._cached_headers_expiry:
+            if self._cred_type == "api_key":
+                # X-goog-api-key is a header name, not an Authorization
+                # scheme; the key travels in its own header.
+                self._cached_headers = {
+                    "X-goog-api-key": self._oauth_response["access_token"]
+                }
+            else:
+                self.refresh()
+                token = self._oauth_response["access_token"]
+                self._cached_headers = {
+                    "Authorization": f"{self.token_type} {token}"
+                }
+            self._cached_headers_expiry = self._expiry
+        return self._cached_headers
     
     @property 
     def token_type(self):
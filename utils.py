@@ -1,6 +1,18 @@
-import requests 
-import pandas as pd 
-from .credentials import Credential
+import asyncio
+import json
+import os
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from time import time
+from .credentials import Credential, _SESSION
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    orjson = None
+    _loads = json.loads
 
 
 def oauth_app(client_secret, scopes=None, port=8088):
@@ -50,6 +62,44 @@ def oauth_app(client_secret, scopes=None, port=8088):
 
 
 
+# Discovery responses barely ever change; cache them for an hour so the
+# ~500 KB service listing and the per-service docs are fetched once, not on
+# every build_params with version=None.
+_DISCOVERY_TTL = 3600
+_discovery_cache = dict()
+
+
+def _discovery_cached(key, fetch):
+    hit = _discovery_cache.get(key)
+    if hit is not None and hit[0] > time():
+        return hit[1]
+    value = fetch()
+    _discovery_cache[key] = (time() + _DISCOVERY_TTL, value)
+    return value
+
+
+def _list_gservice_items():
+    url = "https://www.googleapis.com/discovery/v1/apis/"
+    return _discovery_cached(
+        "apis", lambda: _loads(_SESSION.get(url).content)["items"]
+    )
+
+
+def _latest_service_versions():
+    """
+    Map of lower-cased service name to its highest listed version.
+    """
+    def build():
+        latest = dict()
+        for item in _list_gservice_items():
+            name = item["name"].lower()
+            version = item["version"]
+            if name not in latest or version > latest[name]:
+                latest[name] = version
+        return latest
+    return _discovery_cached("latest_versions", build)
+
+
 def list_all_gservices():
     """
     Google API Discovery Service allows service consumers to list the
@@ -58,10 +108,16 @@ def list_all_gservices():
     The main objective of this function is to list out all the available API
     services provided by Google and their "ids" for further use.
     """
-    url = "https://www.googleapis.com/discovery/v1/apis/"
+    return _list_gservice_items()
 
-    response = requests.get(url)
-    return pd.DataFrame(response.json()["items"])
+
+def list_all_gservices_df(*args, **kwargs):
+    """
+    DataFrame view of `list_all_gservices` for interactive use; pandas is
+    imported here so plain API calls never pay its import cost.
+    """
+    import pandas as pd
+    return pd.DataFrame(list_all_gservices(*args, **kwargs))
 
 
 def get_latest_service_version(service_name):
@@ -69,9 +125,7 @@ def get_latest_service_version(service_name):
     This function takes in `service_name` (e.g. "sheets") and returns the latest
     version of the service.
     """
-    servicesdf = list_all_gservices()
-    return servicesdf["version"].loc[
-        servicesdf["name"].str.lower() == service_name.lower()].max()
+    return _latest_service_versions()[service_name.lower()]
 
 
 def split_method(method):
@@ -99,9 +153,12 @@ def get_service_details(service_name, version=None):
     baseurl = "https://www.googleapis.com/discovery/v1/apis"
     url = f"{baseurl}/{service_name}/{version}/rest"
 
-    response = requests.get(url)
-    response.raise_for_status()
-    return response.json()
+    def fetch():
+        response = _SESSION.get(url)
+        response.raise_for_status()
+        return _loads(response.content)
+
+    return _discovery_cached(f"doc:{service_name}:{version}", fetch)
 
 
 def get_service_scopes(service_name, version=None):
@@ -115,11 +172,31 @@ def get_service_scopes(service_name, version=None):
     return list(response["auth"]["oauth2"]["scopes"].keys())
 
 
+# Discovery docs shipped alongside the package as
+# discovery/<service>_<version>.json are read from disk instead of fetched,
+# taking the first-call download (~1 MB for drive:v3) off the critical path.
+_DISCOVERY_DIR = os.path.join(os.path.dirname(__file__), "discovery")
+
+
+def _load_bundled_doc(service_name, version):
+    path = os.path.join(_DISCOVERY_DIR, f"{service_name}_{version}.json")
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
 def get_method_details_from_doc(method, doc):
-    while len(method) > 1:
-        doc = doc["resources"][method.pop()]
-    doc = doc["methods"][method.pop()]
-    return doc
+    """
+    Walk the discovery doc down to the method document. `method` is the
+    reversed parts sequence produced by `split_method`; it is read, never
+    mutated, so callers can keep and reuse it.
+    """
+    for part in method[:0:-1]:
+        doc = doc["resources"][part]
+    return doc["methods"][method[0]]
 
 
 def get_method_details(method):
@@ -143,8 +220,7 @@ def get_method_scopes(method):
     return response["scopes"]
 
 
-def num2letter(n):
-    """Number to Excel-style column name, e.g., 1 = A, 26 = Z, 27 = AA, 703 = AAA."""
+def _num2letter_slow(n):
     name = ''
     while n > 0:
         n, r = divmod(n - 1, 26)
@@ -152,6 +228,17 @@ def num2letter(n):
     return name
 
 
+# Precomputed at import for the common range A..ZZ (columns 1..702), where
+# virtually all spreadsheet accesses fall; wider columns take the divmod
+# loop.
+_A1 = [None] + [_num2letter_slow(i) for i in range(1, 703)]
+
+
+def num2letter(n):
+    """Number to Excel-style column name, e.g., 1 = A, 26 = Z, 27 = AA, 703 = AAA."""
+    return _A1[n] if 0 < n < 703 else _num2letter_slow(n)
+
+
 def jq_lite(json_dict, query, default=None):
     """
     Query value from json dictionary.
@@ -184,17 +271,27 @@ def jq_lite(json_dict, query, default=None):
         jq_lite(json_dict, "c.c2")
         # ['C2', 'CC2', None]
     """
-    query = query.split(".") if type(query) is str else query
-    query0 = query.pop(0)
-    if type(json_dict) is dict:
-        json_dict = json_dict.get(query0, default)
-    elif type(json_dict) is list:
-        json_dict = [jq_lite(jd, query0, default) for jd in json_dict]
-    else:
-        return None
-    if len(query) > 0:
-        json_dict = jq_lite(json_dict, query, default)
-    return json_dict
+    keys = _compile_jq_path(query) if type(query) is str else tuple(query)
+    return _jq_apply(json_dict, keys, 0, len(keys), default)
+
+
+@lru_cache(maxsize=512)
+def _compile_jq_path(query):
+    """
+    Split a dotted query once and cache it; hot callers re-use the same
+    handful of paths on every invocation.
+    """
+    return tuple(query.split("."))
+
+
+def _jq_apply(node, keys, i, n, default):
+    if i == n:
+        return node
+    if isinstance(node, dict):
+        return _jq_apply(node.get(keys[i], default), keys, i + 1, n, default)
+    if isinstance(node, list):
+        return [_jq_apply(x, keys, i, n, default) for x in node]
+    return None
 
 
 class GoogleAuthBuilder(Credential):
@@ -220,7 +317,103 @@ class GoogleAuthBuilder(Credential):
     def __init__(self, acc_secret):
         Credential.__init__(self, acc_secret)
         self._docs = dict()
-    
+        self._methods = dict()
+        self._client = None
+        self._aclient = None
+        self._aclient_loop = None
+
+    def _get_client(self):
+        """
+        Lazily create a long-lived pooled session for the sync path so
+        back-to-back API calls reuse the TCP+TLS connection instead of
+        paying a full handshake per call.
+        """
+        if self._client is None:
+            self._client = requests.Session()
+            # Sized for the concurrent batch fetchers: enough pooled sockets
+            # that a full worker pool never blocks waiting for a connection.
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=50, pool_maxsize=100
+            )
+            self._client.mount("https://", adapter)
+        return self._client
+
+    def close(self):
+        """
+        Close the pooled HTTP clients.
+        """
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+        if self._aclient is not None:
+            try:
+                asyncio.run(self._aclient.aclose())
+            except RuntimeError:
+                pass
+            self._aclient = None
+            self._aclient_loop = None
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    def _get_aclient(self):
+        """
+        Lazily create a persistent httpx.AsyncClient so concurrent requests
+        multiplex over one HTTP/2 connection instead of paying a TLS
+        handshake per call.
+        """
+        loop = asyncio.get_running_loop()
+        if self._aclient is not None and self._aclient_loop is not loop:
+            # The pooled connections are bound to the loop they were opened
+            # under; a client left over from a previous asyncio.run() would
+            # fail with "Event loop is closed" when reused, so drop it and
+            # start fresh on the current loop.
+            self._aclient = None
+        if self._aclient is None:
+            import httpx
+            self._aclient = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(
+                    max_keepalive_connections=50, max_connections=100
+                )
+            )
+            self._aclient_loop = loop
+        return self._aclient
+
+    async def arequest(self, method, url, params=None, body=None, **kwargs):
+        """
+        Async counterpart of `request` backed by the shared AsyncClient.
+        """
+        client = self._get_aclient()
+        headers = self.headers
+        params = {k: v for k, v in (params or {}).items() if v is not None}
+        if body is not None and orjson is not None:
+            headers = {**headers, "Content-Type": "application/json"}
+            kwargs["content"] = orjson.dumps(
+                body,
+                option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            )
+        else:
+            kwargs["json"] = body
+        response = await client.request(
+            method, url, params=params, headers=headers, **kwargs
+        )
+
+        if response.is_error:
+            print(response.text)
+            response.raise_for_status()
+
+        if response.status_code == 204:
+            return None
+
+        if orjson is not None:
+            return orjson.loads(response.content)
+        return response.json()
+
+
     def _update_doc(self, method):
         """
         This class caches the updated "Google API Discovery" output each time 
@@ -228,9 +421,43 @@ class GoogleAuthBuilder(Credential):
         """
         service, version, method = split_method(method=method)
         if f"{service}:{version}" not in self._docs:
-            res = get_service_details(service, version)
-            self._docs[f"{service}:{version}"] = res 
+            res = _load_bundled_doc(service, version)
+            if res is None:
+                res = get_service_details(service, version)
+            self._docs[f"{service}:{version}"] = res
     
+    def prewarm(self, methods):
+        """
+        Fetch the discovery docs for the given methods concurrently, e.g.
+
+            auth.prewarm([
+                "drive:v3.files.list", "sheets:v4.spreadsheets.get"
+            ])
+
+        so a script touching several services does not pay one serial
+        download per service on its first calls. Bundled docs are used
+        where available; already-cached services are skipped.
+        """
+        pairs = []
+        for m in methods:
+            service, version, _ = split_method(method=m)
+            pair = (service, version)
+            if pair not in pairs and f"{service}:{version}" not in self._docs:
+                pairs.append(pair)
+        if not pairs:
+            return
+
+        def fetch(pair):
+            doc = _load_bundled_doc(*pair)
+            if doc is None:
+                doc = get_service_details(*pair)
+            return doc
+
+        with ThreadPoolExecutor(max_workers=min(8, len(pairs))) as ex:
+            docs = list(ex.map(fetch, pairs))
+        for (service, version), doc in zip(pairs, docs):
+            self._docs[f"{service}:{version}"] = doc
+
     def _fetch_docs(self, method):
         """
         Fetch from the cached "Google API Discovery" output and return a 
@@ -241,51 +468,95 @@ class GoogleAuthBuilder(Credential):
         method_doc = get_method_details_from_doc(method, service_doc)
         return service_doc, method_doc
     
+    def _resolve_method(self, method):
+        """
+        Resolve and cache the static parts of an API method: the discovery
+        docs, the url template and the query-parameter names. These never
+        change for a given method string, so calling the same method in a
+        loop skips the discovery-doc walk entirely.
+        """
+        if method not in self._methods:
+            self._update_doc(method)
+            service_doc, method_doc = self._fetch_docs(method)
+            url_template = service_doc["baseUrl"] + method_doc["path"]
+            query_params = tuple(
+                k for k, v in method_doc["parameters"].items()
+                if v["location"] == "query"
+            )
+            body_props = None
+            if method_doc.get("request"):
+                schema = service_doc["schemas"][method_doc["request"]["$ref"]]
+                body_props = tuple(schema["properties"].keys())
+            self._methods[method] = (
+                service_doc, method_doc, method_doc["httpMethod"],
+                url_template, "{" in url_template, query_params, body_props
+            )
+        return self._methods[method]
+
     def build_params(self, **kwargs):
         """
-        Buiuld the required http method, url, body and params based on the 
+        Buiuld the required http method, url, body and params based on the
         API method and "Google API Discovery" docs
         """
         locals = kwargs
         kwargs = locals.pop("kwargs", dict())
-        self._update_doc(locals["method"])
-        service_doc, method_doc = self._fetch_docs(locals["method"])
-        url = service_doc["baseUrl"] + method_doc["path"]
-        url = url.format(**locals)
-        query_params = [k for k, v in method_doc["parameters"].items() if v["location"] == "query"]
-        
-        params = dict()
-        for k in query_params:
-            params[k] = locals.get(k) if locals.get(k) else kwargs.get(k)
+        (service_doc, method_doc, http_method, url_template, has_url_vars,
+         query_params, body_props) = self._resolve_method(locals["method"])
+        url = url_template.format(**locals) if has_url_vars else url_template
+
+        # One merged view (named args win over extra kwargs) serves both
+        # lookups; the old locals.get(k) or-else chain also dropped
+        # legitimate falsy values like 0 or "".
+        merged = {**kwargs, **locals}
+        params = {k: merged[k] for k in query_params if k in merged}
 
         body = None
-        if method_doc.get("request"):
-            body = dict()
-            body_doc = service_doc["schemas"][method_doc.get("request")["$ref"]]
-            for k in body_doc["properties"].keys():
-                if k in locals:
-                    body[k] = locals[k]
-                elif k in kwargs:
-                    body[k] = kwargs[k]
-
-        return service_doc, method_doc, method_doc["httpMethod"], url, params, body
+        if body_props is not None:
+            body = {k: merged[k] for k in body_props if k in merged}
+
+        return service_doc, method_doc, http_method, url, params, body
     
-    def request(self, method, url, params=None, body=None, **kwargs):
+    def request(self, method, url, params=None, body=None, stream=False,
+                raw_body=None, **kwargs):
         """
-        Send API request
+        Send API request. When `stream` is true the raw response object is
+        returned (after status checking) so callers can parse the body
+        incrementally instead of materializing it. `raw_body` sends
+        pre-encoded JSON bytes as-is, skipping re-serialization.
         """
-        self.refresh()
+        kwargs["stream"] = stream
         args = {
             "method": method, "url": url, "headers": self.headers,
-            "params": params, "json": body, **kwargs
+            "params": params, **kwargs
         }
-        response = requests.request(**args)
+        if raw_body is not None:
+            args["data"] = raw_body
+            args["headers"] = {**args["headers"], "Content-Type": "application/json"}
+        elif body is not None and orjson is not None:
+            # orjson emits bytes directly and serializes numpy scalars
+            # without a Python-level cast, which dominates large
+            # update_sheet/append_sheet payloads.
+            args["data"] = orjson.dumps(
+                body,
+                option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            )
+            args["headers"] = {**args["headers"], "Content-Type": "application/json"}
+        else:
+            args["json"] = body
+        response = self._get_client().request(**args)
 
         if not response.ok:
             print(response.text)
             response.raise_for_status()
 
+        if stream:
+            return response
+
         if response.status_code == 204:
             return None
 
+        # orjson parses large sheet/Drive payloads several times faster than
+        # the stdlib decoder behind response.json().
+        if orjson is not None:
+            return orjson.loads(response.content)
         return response.json()